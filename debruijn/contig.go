@@ -0,0 +1,84 @@
+package debruijn
+
+import (
+	"strings"
+)
+
+// ===================================
+// Contig Extraction
+// ===================================
+
+func ExtractContigs(graph Graph) []string {
+	num_nodes := graph.Len()
+	visited := make([]bool, num_nodes)
+	contigs := make([]string, 0)
+
+	for id := 0; id < num_nodes; id++ {
+		node := graph.GetNodeByID(id)
+
+		if isBranchFree(node) {
+			continue
+		}
+
+		succs := node.GetSuccessors()
+
+		if len(succs) == 0 && len(node.GetPredecessors()) == 0 {
+			kmer := node.GetKmer()
+			contigs = append(contigs, kmer.String())
+			continue
+		}
+
+		for _, nt := range succs {
+			contigs = append(contigs, walkPath(graph, node, nt, visited))
+		}
+	}
+
+	// Any node still unvisited sits on an isolated cycle; emit each cycle once.
+	for id := 0; id < num_nodes; id++ {
+		if visited[id] {
+			continue
+		}
+
+		node := graph.GetNodeByID(id)
+
+		if !isBranchFree(node) {
+			continue
+		}
+
+		visited[id] = true
+		contigs = append(contigs, walkPath(graph, node, node.GetSuccessors()[0], visited))
+	}
+
+	return contigs
+}
+
+// ===================================
+// Contig Utilities
+// ===================================
+
+func isBranchFree(node GraphNode) bool {
+	return len(node.GetPredecessors()) == 1 && len(node.GetSuccessors()) == 1
+}
+
+func walkPath(graph Graph, node GraphNode, nt int, visited []bool) string {
+	alphabet := [4]byte{'A', 'C', 'G', 'T'}
+	var contig strings.Builder
+
+	kmer := node.GetKmer()
+	contig.WriteString(kmer.String())
+
+	for {
+		kmer = kmer.GenerateSuccessor(alphabet[nt])
+		contig.WriteByte(alphabet[nt])
+
+		next_id, next_node, ok := graph.GetNode(kmer)
+		if !ok || !isBranchFree(next_node) || visited[next_id] {
+			break
+		}
+
+		visited[next_id] = true
+		nt = next_node.GetSuccessors()[0]
+	}
+
+	return contig.String()
+}
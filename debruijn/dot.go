@@ -0,0 +1,41 @@
+package debruijn
+
+import (
+	"bufio"
+	"fmt"
+	"io"
+)
+
+// ===================================
+// DOT Export
+// ===================================
+
+func WriteDot(graph Graph, w io.Writer, max_nodes int) error {
+	num_nodes := graph.Len()
+
+	if max_nodes > 0 && num_nodes > max_nodes {
+		return fmt.Errorf("graph has %d nodes, more than the render limit of %d", num_nodes, max_nodes)
+	}
+
+	alphabet := [4]byte{'A', 'C', 'G', 'T'}
+	buf := bufio.NewWriter(w)
+
+	fmt.Fprintln(buf, "digraph debruijn {")
+
+	for id := 0; id < num_nodes; id++ {
+		node := graph.GetNodeByID(id)
+		kmer := node.GetKmer()
+		rep := kmer.String()
+
+		fmt.Fprintf(buf, "\t\"%s\" [label=\"%s (%d)\"]\n", rep, rep, node.GetFrequency())
+
+		for _, nt := range node.GetSuccessors() {
+			succ_kmer := kmer.GenerateSuccessor(alphabet[nt])
+			fmt.Fprintf(buf, "\t\"%s\" -> \"%s\"\n", rep, succ_kmer.String())
+		}
+	}
+
+	fmt.Fprintln(buf, "}")
+
+	return buf.Flush()
+}
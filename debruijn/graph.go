@@ -10,6 +10,7 @@ type Graph interface {
 	GetNumNodesSeen()								int
 	NewNode(Kmer)									GraphNode
 	GetNode(Kmer)									(int, GraphNode, bool)
+	GetNodeByID(int)								GraphNode
 	SetNode(Kmer, GraphNode)						int
 	ConnectNodeToGraph(Kmer, int, GraphNode)
 	AddNode(Kmer)									int
@@ -31,3 +32,37 @@ type GraphNode interface {
 }
 
 type NodeGenerator func(Kmer) GraphNode
+
+// ===================================
+// Graph Utilities
+// ===================================
+
+func CollectFrequencies(graph Graph) []int {
+	freqs := make([]int, graph.Len())
+
+	for i := range freqs {
+		freqs[i] = graph.GetNodeByID(i).GetFrequency()
+	}
+
+	return freqs
+}
+
+func ConnectNode(graph Graph, kmer Kmer, node GraphNode) {
+	nts := [4]byte{'A', 'C', 'G', 'T'}
+
+	for i, nt := range nts {
+		prec_kmer := kmer.GeneratePredecessor(nt)
+
+		if _, prec_node, ok := graph.GetNode(prec_kmer); ok {
+			node.AddPredecessor(i)
+			prec_node.AddSuccessor(kmer.GetLastNucleotide())
+		}
+
+		succ_kmer := kmer.GenerateSuccessor(nt)
+
+		if _, succ_node, ok := graph.GetNode(succ_kmer); ok {
+			node.AddSuccessor(i)
+			succ_node.AddPredecessor(kmer.GetFirstNucleotide())
+		}
+	}
+}
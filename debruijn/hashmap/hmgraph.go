@@ -10,12 +10,13 @@ import (
 
 type HMGraph struct {
 	lookup			map[uint64]int
-	nodes			[]*debruijn.GraphNode
+	nodes			[]debruijn.GraphNode
+	num_seen		int
 	newNode			debruijn.NodeGenerator
 }
 
 func NewGraph(newNode debruijn.NodeGenerator) debruijn.Graph {
-	var graph debruijn.Graph = &HMGraph{make(map[uint64]int), make([]*debruijn.GraphNode, 0, 3000000), newNode}
+	var graph debruijn.Graph = &HMGraph{make(map[uint64]int, 3000000), make([]debruijn.GraphNode, 0, 3000000), 0, newNode}
 	return graph
 }
 
@@ -28,23 +29,11 @@ func (graph *HMGraph) Len() int {
 }
 
 func (graph *HMGraph) GetFrequencies() []int {
-	freqs := make([]int, graph.Len())
-
-	for i := range freqs {
-		freqs[i] = graph.GetNodeByID(i).GetFrequency()
-	}
-
-	return freqs
+	return debruijn.CollectFrequencies(graph)
 }
 
 func (graph *HMGraph) GetNumNodesSeen() int {
-	num_seen := 0
-
-	for _, freq := range graph.GetFrequencies() {
-		num_seen += freq
-	}
-
-	return num_seen
+	return graph.num_seen
 }
 
 func (graph *HMGraph) NewNode(kmer debruijn.Kmer) debruijn.GraphNode {
@@ -64,7 +53,7 @@ func (graph *HMGraph) GetNode(kmer debruijn.Kmer) (int, debruijn.GraphNode, bool
 	var node debruijn.GraphNode
 
 	if kmer_id, ok := graph.GetID(kmer); ok {
-		node = *graph.nodes[kmer_id]
+		node = graph.nodes[kmer_id]
 		return kmer_id, node, ok
 	} else {
 		return -1, node, ok
@@ -72,29 +61,19 @@ func (graph *HMGraph) GetNode(kmer debruijn.Kmer) (int, debruijn.GraphNode, bool
 }
 
 func (graph *HMGraph) GetNodeByID(kmer_id int) debruijn.GraphNode {
-	return *graph.nodes[kmer_id]
+	return graph.nodes[kmer_id]
 }
 
 func (graph *HMGraph) SetNode(kmer debruijn.Kmer, node debruijn.GraphNode) int {
 	kmer_id := graph.Len()
-	graph.nodes = append(graph.nodes, &node)
+	graph.nodes = append(graph.nodes, node)
 	graph.SetID(kmer, kmer_id)
 
 	return kmer_id
 }
 
 func (graph *HMGraph) ConnectNodeToGraph(kmer debruijn.Kmer, kmer_id int, node debruijn.GraphNode) {
-	nts := [4]byte{'A', 'C', 'G', 'T'}
-
-	for i, nt := range nts {
-		prec_kmer := kmer.GeneratePredecessor(nt)
-
-		if _, prec_node, ok := graph.GetNode(prec_kmer); ok {
-			node.AddPredecessor(i)
-			prec_node.AddSuccessor(kmer.GetLastNucleotide())
-			break
-		}
-	}
+	debruijn.ConnectNode(graph, kmer, node)
 }
 
 func (graph *HMGraph) AddNode(kmer debruijn.Kmer) int {
@@ -102,6 +81,8 @@ func (graph *HMGraph) AddNode(kmer debruijn.Kmer) int {
 	var node debruijn.GraphNode
 	var ok bool
 
+	graph.num_seen++
+
 	if kmer_id, node, ok = graph.GetNode(kmer); ok {
 		node.IncrementFrequency()
 	} else {
@@ -114,10 +95,10 @@ func (graph *HMGraph) AddNode(kmer debruijn.Kmer) int {
 }
 
 func (graph *HMGraph) AddNodes(kmers []debruijn.Kmer) []int {
-	ids := make([]int, 0)
+	ids := make([]int, len(kmers))
 
-	for _, kmer := range kmers {
-		ids = append(ids, graph.AddNode(kmer))
+	for i, kmer := range kmers {
+		ids[i] = graph.AddNode(kmer)
 	}
 
 	return ids
@@ -11,12 +11,11 @@ import (
 type HMNode struct {
 	kmer			debruijn.Kmer
 	frequency		int
-	predecessors	[]int
-	successors		[]int
+	neighbors		uint8
 }
 
 func NewNode(kmer debruijn.Kmer) debruijn.GraphNode {
-	var node debruijn.GraphNode = &HMNode{kmer, 1, make([]int, 0, 2), make([]int, 0, 2)}
+	var node debruijn.GraphNode = &HMNode{kmer, 1, 0}
 	return node
 }
 
@@ -41,43 +40,43 @@ func (node *HMNode) IncrementFrequency() {
 }
 
 func (node *HMNode) GetPredecessors() []int {
-	return node.predecessors
-}
+	preds := make([]int, 0, 4)
 
-func (node *HMNode) IsAPredecessor(needle int) bool {
-	for _, pred := range node.predecessors {
-		if pred == needle {
-			return true
+	for nt := 0; nt < 4; nt++ {
+		if node.IsAPredecessor(nt) {
+			preds = append(preds, nt)
 		}
 	}
 
-	return false
+	return preds
 }
 
-func (node *HMNode) AddPredecessor(pred_id int) {
-	if !node.IsAPredecessor(pred_id) {
-		node.predecessors = append(node.predecessors, pred_id)
-	}
+func (node *HMNode) IsAPredecessor(nt int) bool {
+	return (node.neighbors >> uint(4 + nt)) & 0x01 == 1
 }
 
-func (node *HMNode) GetSuccessors() []int {
-	return node.successors
+func (node *HMNode) AddPredecessor(nt int) {
+	node.neighbors = node.neighbors | (0x10 << uint(nt))
 }
 
-func (node *HMNode) IsASuccessor(needle int) bool {
-	for _, succ := range node.successors {
-		if succ == needle {
-			return true
+func (node *HMNode) GetSuccessors() []int {
+	succs := make([]int, 0, 4)
+
+	for nt := 0; nt < 4; nt++ {
+		if node.IsASuccessor(nt) {
+			succs = append(succs, nt)
 		}
 	}
 
-	return false
+	return succs
 }
 
-func (node *HMNode) AddSuccessor(succ_id int) {
-	if !node.IsASuccessor(succ_id) {
-		node.successors = append(node.successors, succ_id)
-	}
+func (node *HMNode) IsASuccessor(nt int) bool {
+	return (node.neighbors >> uint(nt)) & 0x01 == 1
+}
+
+func (node *HMNode) AddSuccessor(nt int) {
+	node.neighbors = node.neighbors | (0x01 << uint(nt))
 }
 
 func (node *HMNode) Merge(other_entry debruijn.GraphNode) {
@@ -87,12 +86,12 @@ func (node *HMNode) Merge(other_entry debruijn.GraphNode) {
 	if kmer_a.Equals(kmer_b) {
 		node.SetFrequency(node.GetFrequency() + other_entry.GetFrequency())
 
-		for _, pred_id := range other_entry.GetPredecessors() {
-			node.AddPredecessor(pred_id)
+		for _, nt := range other_entry.GetPredecessors() {
+			node.AddPredecessor(nt)
 		}
 
-		for _, succ_id := range other_entry.GetSuccessors() {
-			node.AddSuccessor(succ_id)
+		for _, nt := range other_entry.GetSuccessors() {
+			node.AddSuccessor(nt)
 		}
 	}
 }
@@ -15,7 +15,7 @@ type Kmer struct {
 
 func NewKmer(kmer string) Kmer {
 	return Kmer{
-		data: ConvertStringToUInt64(PreprocessString(kmer)),
+		data: ConvertStringToUInt64(kmer),
 		length: uint8(len(kmer)),
 	}
 }
@@ -36,19 +36,24 @@ func (kmer *Kmer) GetValue() uint64 {
 	return kmer.data
 }
 
+func (kmer *Kmer) GetFirstNucleotide() int {
+	return int((kmer.GetValue() >> uint((kmer.Len() - 1) * 2)) & 0x03)
+}
+
 func (kmer *Kmer) GetLastNucleotide() int {
 	return int(kmer.GetValue() & 0x03)
 }
 
 func (kmer *Kmer) String() string {
-	alphabet := [4]string{"A", "C", "G", "T"}
+	alphabet := [4]byte{'A', 'C', 'G', 'T'}
 	var rep strings.Builder
+	rep.Grow(kmer.Len())
 
-	i := 0
-	for i < kmer.Len() {
+	i := kmer.Len() - 1
+	for i >= 0 {
 		var tmp uint64 = (kmer.data >> uint64(i * 2)) & 0x03
-		rep.WriteString(alphabet[tmp])
-		i++
+		rep.WriteByte(alphabet[tmp])
+		i--
 	}
 
 	return rep.String()
@@ -59,39 +64,59 @@ func (kmer *Kmer) Equals(other Kmer) bool {
 }
 
 func (kmer *Kmer) GeneratePredecessor(nt byte) Kmer {
-	alphabet := [4]byte{'A', 'C', 'G', 'T'}
-
-	var i uint64
-	for k := range alphabet {
-		if alphabet[k] == nt {
-			i = uint64(k)
-			break
-		}
-	}
-
-	tmp := GenerateNOneBits(kmer.Len() - 2)
-	tmp = kmer.data & tmp
+	i := ConvertNucleotideToUInt64(nt)
 
-	pred := (i << kmer.RawLen() - 2) | tmp
+	pred := (i << uint((kmer.Len() - 1) * 2)) | (kmer.data >> 2)
 	return Kmer{pred, kmer.RawLen()}
 }
 
 func (kmer *Kmer) GenerateSuccessor(nt byte) Kmer {
-	alphabet := [4]byte{'A', 'C', 'G', 'T'}
+	i := ConvertNucleotideToUInt64(nt)
+
+	succ := ((kmer.data << 2) | i) & GenerateNOneBits(kmer.Len() * 2)
+	return Kmer{succ, kmer.RawLen()}
+}
+
+// ===================================
+// Kmer Extraction
+// ===================================
 
-	var i uint64
-	for k := range alphabet {
-		if alphabet[k] == nt {
-			i = uint64(k)
-			break
+func forEachKmerCode(seq string, k int, fn func (uint64)) {
+	if len(seq) < k {
+		return
+	}
+
+	mask := GenerateNOneBits(k * 2)
+
+	var code uint64
+	for i := 0; i < len(seq); i++ {
+		code = ((code << 2) | ConvertNucleotideToUInt64(seq[i])) & mask
+
+		if i >= k - 1 {
+			fn(code)
 		}
 	}
+}
+
+func KmersFromSequence(seq string, k int) []Kmer {
+	num_kmers := len(seq) - k + 1
+	if num_kmers <= 0 {
+		return nil
+	}
 
-	tmp := GenerateNOneBits(kmer.Len() - 2) << 2
-	tmp = kmer.data & tmp
+	kmers := make([]Kmer, 0, num_kmers)
 
-	succ := i | tmp
-	return Kmer{succ, kmer.RawLen()}
+	forEachKmerCode(seq, k, func (code uint64) {
+		kmers = append(kmers, Kmer{code, uint8(k)})
+	})
+
+	return kmers
+}
+
+func AddSequenceToGraph(graph Graph, seq string, k int) {
+	forEachKmerCode(seq, k, func (code uint64) {
+		graph.AddNode(Kmer{code, uint8(k)})
+	})
 }
 
 // ===================================
@@ -99,50 +124,31 @@ func (kmer *Kmer) GenerateSuccessor(nt byte) Kmer {
 // ===================================
 
 func GenerateNOneBits(n int) uint64 {
-	var v uint64 = 0
-
-	var i uint64 = 0
-	for i < uint64(n) {
-		v = (v << 1) | 0x01
-		i++
+	if n >= 64 {
+		return ^uint64(0)
 	}
 
-	return v
+	return (uint64(1) << uint(n)) - 1
 }
 
-func ConvertStringToUInt64(kmer string) uint64 {
-	var rep uint64
-
-	for i := range kmer {
-		var tmp uint64
-
-		switch ch := kmer[i]; ch {
-		case 'A':
-			tmp = 0
-		case 'C':
-			tmp = 1
-		case 'G':
-			tmp = 2
-		case 'T':
-			tmp = 3
-		}
+var nucleotide_codes [256]uint64
 
-		rep = (rep << 2) | tmp
-	}
+func init() {
+	nucleotide_codes['C'], nucleotide_codes['c'] = 1, 1
+	nucleotide_codes['G'], nucleotide_codes['g'] = 2, 2
+	nucleotide_codes['T'], nucleotide_codes['t'] = 3, 3
+}
 
-	return rep
+func ConvertNucleotideToUInt64(nt byte) uint64 {
+	return nucleotide_codes[nt]
 }
 
-func PreprocessString(kmer string) string {
-	var tmp strings.Builder
+func ConvertStringToUInt64(kmer string) uint64 {
+	var rep uint64
 
-	for _, nt := range kmer {
-		if nt != 'A' && nt != 'C' && nt != 'G' && nt != 'T' {
-			tmp.WriteString("A")
-		} else {
-			tmp.WriteString(string(nt))
-		}
+	for i := range kmer {
+		rep = (rep << 2) | ConvertNucleotideToUInt64(kmer[i])
 	}
 
-	return tmp.String()
+	return rep
 }
@@ -10,12 +10,14 @@ import (
 // ===================================
 
 type SortedGraph struct {
-	nodes			[]*debruijn.GraphNode
+	keys			[]uint64
+	nodes			[]debruijn.GraphNode
+	num_seen		int
 	newNode			debruijn.NodeGenerator
 }
 
 func NewGraph(newNode debruijn.NodeGenerator) debruijn.Graph {
-	var graph debruijn.Graph = &SortedGraph{make([]*debruijn.GraphNode, 0, 3000000), newNode}
+	var graph debruijn.Graph = &SortedGraph{make([]uint64, 0, 3000000), make([]debruijn.GraphNode, 0, 3000000), 0, newNode}
 	return graph
 }
 
@@ -28,54 +30,44 @@ func (graph *SortedGraph) Len() int {
 }
 
 func (graph *SortedGraph) GetFrequencies() []int {
-	freqs := make([]int, graph.Len())
-
-	for i := range freqs {
-		freqs[i] = (*graph.nodes[i]).GetFrequency()
-	}
-
-	return freqs
+	return debruijn.CollectFrequencies(graph)
 }
 
 func (graph *SortedGraph) GetNumNodesSeen() int {
-	num_seen := 0
-
-	for _, freq := range graph.GetFrequencies() {
-		num_seen += freq
-	}
-
-	return num_seen
+	return graph.num_seen
 }
 
 func (graph *SortedGraph) NewNode(kmer debruijn.Kmer) debruijn.GraphNode {
 	return graph.newNode(kmer)
 }
 
+func (graph *SortedGraph) findIndex(value uint64) int {
+	return sort.Search(len(graph.keys), func (i int) bool {
+		return value <= graph.keys[i]
+	})
+}
+
 func (graph *SortedGraph) GetNode(kmer debruijn.Kmer) (int, debruijn.GraphNode, bool) {
 	var node debruijn.GraphNode
 
 	n := graph.Len()
-	i := sort.Search(n, func (i int) bool {
-		other_kmer := (*graph.nodes[i]).GetKmer()
-		return kmer.GetValue() <= other_kmer.GetValue()
-	})
+	i := graph.findIndex(kmer.GetValue())
 
 	if i == n {
 		return -1, node, false
-	} else if node = (*graph.nodes[i]); node.GetKmer() == kmer {
+	} else if node = graph.nodes[i]; graph.keys[i] == kmer.GetValue() {
 		return i, node, true
 	} else {
 		return i, node, false
 	}
 }
 
-func (graph *SortedGraph) SetNode(kmer debruijn.Kmer, node debruijn.GraphNode) int {
-	n := graph.Len()
+func (graph *SortedGraph) GetNodeByID(kmer_ind int) debruijn.GraphNode {
+	return graph.nodes[kmer_ind]
+}
 
-	i := sort.Search(n, func (i int) bool {
-		other_kmer := (*graph.nodes[i]).GetKmer()
-		return kmer.GetValue() <= other_kmer.GetValue()
-	})
+func (graph *SortedGraph) SetNode(kmer debruijn.Kmer, node debruijn.GraphNode) int {
+	i := graph.findIndex(kmer.GetValue())
 
 	graph.SetNodeAtIndex(i, node)
 
@@ -83,30 +75,27 @@ func (graph *SortedGraph) SetNode(kmer debruijn.Kmer, node debruijn.GraphNode) i
 }
 
 func (graph *SortedGraph) SetNodeAtIndex(i int, node debruijn.GraphNode) int {
+	kmer := node.GetKmer()
+
 	if i >= 0 && i < graph.Len() {
 		graph.nodes = append(graph.nodes, graph.nodes[graph.Len() - 1])
 		copy(graph.nodes[i + 1:], graph.nodes[i : graph.Len() - 2])
-		graph.nodes[i] = &node
+		graph.nodes[i] = node
+
+		graph.keys = append(graph.keys, 0)
+		copy(graph.keys[i + 1:], graph.keys[i : len(graph.keys) - 1])
+		graph.keys[i] = kmer.GetValue()
 	} else {
 		i = graph.Len()
-		graph.nodes = append(graph.nodes, &node)
+		graph.nodes = append(graph.nodes, node)
+		graph.keys = append(graph.keys, kmer.GetValue())
 	}
 
 	return i
 }
 
 func (graph *SortedGraph) ConnectNodeToGraph(kmer debruijn.Kmer, kmer_ind int, node debruijn.GraphNode) {
-	nts := [4]byte{'A', 'C', 'G', 'T'}
-
-	for i, nt := range nts {
-		prec_kmer := kmer.GeneratePredecessor(nt)
-
-		if _, prec_node, ok := graph.GetNode(prec_kmer); ok {
-			node.AddPredecessor(i)
-			prec_node.AddSuccessor(kmer.GetLastNucleotide())
-			break
-		}
-	}
+	debruijn.ConnectNode(graph, kmer, node)
 }
 
 func (graph *SortedGraph) AddNode(kmer debruijn.Kmer) int {
@@ -114,22 +103,24 @@ func (graph *SortedGraph) AddNode(kmer debruijn.Kmer) int {
 	var node debruijn.GraphNode
 	var ok bool
 
+	graph.num_seen++
+
 	if kmer_ind, node, ok = graph.GetNode(kmer); ok {
 		node.IncrementFrequency()
 	} else {
 		node = graph.newNode(kmer)
 		kmer_ind = graph.SetNodeAtIndex(kmer_ind, node)
-		// graph.ConnectNodeToGraph(kmer, kmer_ind, node)
+		graph.ConnectNodeToGraph(kmer, kmer_ind, node)
 	}
 
 	return kmer_ind
 }
 
 func (graph *SortedGraph) AddNodes(kmers []debruijn.Kmer) []int {
-	ids := make([]int, 0)
+	ids := make([]int, len(kmers))
 
-	for _, kmer := range kmers {
-		ids = append(ids, graph.AddNode(kmer))
+	for i, kmer := range kmers {
+		ids[i] = graph.AddNode(kmer)
 	}
 
 	return ids
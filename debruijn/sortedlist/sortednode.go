@@ -43,23 +43,19 @@ func (node *SortedNode) IncrementFrequency() {
 }
 
 func (node *SortedNode) GetPredecessors() []int {
-	preds := make([]int, 4)
+	preds := make([]int, 0, 4)
 
-	var i uint8 = 3
-	for int(i) - 3 < len(preds) {
-		bit := 0x01 & (node.neighbors >> i)
-		if bit == 1 {
-			preds[i - 3] = 1
+	for nt := 0; nt < 4; nt++ {
+		if node.IsAPredecessor(nt) {
+			preds = append(preds, nt)
 		}
-
-		i++
 	}
 
 	return preds
 }
 
 func (node *SortedNode) IsAPredecessor(nt int) bool {
-	bit := (node.neighbors >> uint8(3 + nt)) & 0x01
+	bit := (node.neighbors >> uint8(4 + nt)) & 0x01
 
 	if bit == 1 {
 		return true
@@ -69,32 +65,16 @@ func (node *SortedNode) IsAPredecessor(nt int) bool {
 }
 
 func (node *SortedNode) AddPredecessor(nt int) {
-	var bit uint8
-
-	if nt == 0 {
-		bit = 0x10
-	} else if nt == 1 {
-		bit = 0x20
-	} else if nt == 2 {
-		bit = 0x40
-	} else if nt == 3 {
-		bit = 0x80
-	}
-
-	node.neighbors = node.neighbors | bit
+	node.neighbors = node.neighbors | (0x10 << uint(nt))
 }
 
 func (node *SortedNode) GetSuccessors() []int {
-	succs := make([]int, 4)
+	succs := make([]int, 0, 4)
 
-	var i uint8 = 0
-	for int(i) < len(succs) {
-		bit := 0x01 & (node.neighbors >> i)
-		if bit == 1 {
-			succs[i] = 1
+	for nt := 0; nt < 4; nt++ {
+		if node.IsASuccessor(nt) {
+			succs = append(succs, nt)
 		}
-
-		i++
 	}
 
 	return succs
@@ -111,19 +91,7 @@ func (node *SortedNode) IsASuccessor(nt int) bool {
 }
 
 func (node *SortedNode) AddSuccessor(nt int) {
-	var bit uint8
-
-	if nt == 0 {
-		bit = 0x01
-	} else if nt == 1 {
-		bit = 0x02
-	} else if nt == 2 {
-		bit = 0x04
-	} else if nt == 3 {
-		bit = 0x08
-	}
-
-	node.neighbors = node.neighbors | bit
+	node.neighbors = node.neighbors | (0x01 << uint(nt))
 }
 
 func (node *SortedNode) Merge(other_entry debruijn.GraphNode) {
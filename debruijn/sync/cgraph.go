@@ -2,6 +2,7 @@ package sync
 
 import (
 	"sync"
+
 	"velour/debruijn"
 )
 
@@ -11,11 +12,12 @@ import (
 
 type CGraph struct {
 	data			debruijn.Graph
+	num_seen		int
 	mu				sync.RWMutex
 }
 
-func NewGraph(graph debruijn.Graph) debruijn.Graph {
-	var graph debruijn.Graph = &CGraph{graph, sync.RWMutex{}}
+func NewGraph(data debruijn.Graph) debruijn.Graph {
+	var graph debruijn.Graph = &CGraph{data, 0, sync.RWMutex{}}
 	return graph
 }
 
@@ -41,35 +43,42 @@ func (graph *CGraph) GetNumNodesSeen() int {
 	graph.mu.RLock()
 	defer graph.mu.RUnlock()
 
-	return graph.data.GetNumNodesSeen()
+	return graph.num_seen
 }
 
-func (graph *CGraph) NewNode(kmer string) debruijn.GraphNode {
+func (graph *CGraph) NewNode(kmer debruijn.Kmer) debruijn.GraphNode {
 	return graph.data.NewNode(kmer)
 }
 
-func (graph *CGraph) GetNode(kmer string) (int, debruijn.GraphNode, bool) {
+func (graph *CGraph) GetNode(kmer debruijn.Kmer) (int, debruijn.GraphNode, bool) {
 	graph.mu.RLock()
 	defer graph.mu.RUnlock()
 
 	return graph.data.GetNode(kmer)
 }
 
-func (graph *CGraph) SetNode(kmer string, node debruijn.GraphNode) int {
+func (graph *CGraph) GetNodeByID(kmer_id int) debruijn.GraphNode {
+	graph.mu.RLock()
+	defer graph.mu.RUnlock()
+
+	return graph.data.GetNodeByID(kmer_id)
+}
+
+func (graph *CGraph) SetNode(kmer debruijn.Kmer, node debruijn.GraphNode) int {
 	graph.mu.Lock()
 	defer graph.mu.Unlock()
 
 	return graph.data.SetNode(kmer, node)
 }
 
-func (graph *CGraph) ConnectNodeToGraph(kmer string, kmer_id int, node debruijn.GraphNode) {
+func (graph *CGraph) ConnectNodeToGraph(kmer debruijn.Kmer, kmer_id int, node debruijn.GraphNode) {
 	graph.mu.Lock()
 	defer graph.mu.Unlock()
 
 	graph.data.ConnectNodeToGraph(kmer, kmer_id, node)
 }
 
-func (graph *CGraph) addKmerEntry(kmer string, node debruijn.GraphNode) int {
+func (graph *CGraph) addKmerEntry(kmer debruijn.Kmer, node debruijn.GraphNode) int {
 	graph.mu.Lock()
 	defer graph.mu.Unlock()
 
@@ -88,11 +97,15 @@ func (graph *CGraph) addKmerEntry(kmer string, node debruijn.GraphNode) int {
 	return kmer_id
 }
 
-func (graph *CGraph) AddNode(kmer string) int {
+func (graph *CGraph) AddNode(kmer debruijn.Kmer) int {
 	var kmer_id int
 	var node debruijn.GraphNode
 	var ok bool
 
+	graph.mu.Lock()
+	graph.num_seen++
+	graph.mu.Unlock()
+
 	if kmer_id, node, ok = graph.GetNode(kmer); ok {
 		node.IncrementFrequency()
 	} else {
@@ -103,11 +116,11 @@ func (graph *CGraph) AddNode(kmer string) int {
 	return kmer_id
 }
 
-func (graph *CGraph) AddNodes(kmers []string) []int {
-	ids := make([]int, 0)
+func (graph *CGraph) AddNodes(kmers []debruijn.Kmer) []int {
+	ids := make([]int, len(kmers))
 
-	for _, kmer := range kmers {
-		ids = append(ids, graph.AddNode(kmer))
+	for i, kmer := range kmers {
+		ids[i] = graph.AddNode(kmer)
 	}
 
 	return ids
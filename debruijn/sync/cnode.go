@@ -2,6 +2,7 @@ package sync
 
 import (
 	"sync"
+
 	"velour/debruijn"
 )
 
@@ -14,16 +15,18 @@ type CNode struct {
 	mu				sync.Mutex
 }
 
-func NewNode(kmer string, newNode debruijn.NodeGenerator) *debruijn.GraphNode {
-	var node debruijn.GraphNode = &CNode{newNode(kmer), sync.Mutex{}}
-	return node
+func NewNodeGenerator(newNode debruijn.NodeGenerator) debruijn.NodeGenerator {
+	return func (kmer debruijn.Kmer) debruijn.GraphNode {
+		var node debruijn.GraphNode = &CNode{newNode(kmer), sync.Mutex{}}
+		return node
+	}
 }
 
 // ===================================
 // CNode Functions
 // ===================================
 
-func (node *CNode) GetKmer() string {
+func (node *CNode) GetKmer() debruijn.Kmer {
 	node.mu.Lock()
 	defer node.mu.Unlock()
 
@@ -45,7 +48,10 @@ func (node *CNode) SetFrequency(new_frequency int) {
 }
 
 func (node *CNode) IncrementFrequency() {
-	node.SetFrequency(node.GetFrequency() + 1)
+	node.mu.Lock()
+	defer node.mu.Unlock()
+
+	node.data.IncrementFrequency()
 }
 
 func (node *CNode) GetPredecessors() []int {
@@ -94,15 +100,5 @@ func (node *CNode) Merge(other_entry debruijn.GraphNode) {
 	node.mu.Lock()
 	defer node.mu.Unlock()
 
-	if node.data.GetKmer() == other_entry.GetKmer() {
-		node.data.SetFrequency(node.data.GetFrequency() + other_entry.GetFrequency())
-
-		for _, pred_id := range other_entry.GetPredecessors() {
-			node.data.AddPredecessor(pred_id)
-		}
-
-		for _, succ_id := range other_entry.GetSuccessors() {
-			node.data.AddSuccessor(succ_id)
-		}
-	}
+	node.data.Merge(other_entry)
 }
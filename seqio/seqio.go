@@ -3,8 +3,6 @@ package seqio
 import (
 	"os"
 	"bufio"
-	"strings"
-	"math"
 
 	"velour/debruijn"
 )
@@ -20,14 +18,16 @@ func checkError(e error) {
 // ===================================
 
 func EstimateK(genome_size int) int {
-	k := 1.0
-	for {
-		if math.Pow(4.0, k) >= float64(genome_size * 2 * 10) {
-			return int(k)
-		}
+	target := genome_size * 2 * 10
 
+	k := 1
+	kmer_space := 4
+	for kmer_space < target {
+		kmer_space *= 4
 		k++
 	}
+
+	return k
 }
 
 // ===================================
@@ -37,7 +37,7 @@ func EstimateK(genome_size int) int {
 type ShortRead string
 
 func NewShortRead(raw_sr string) ShortRead {
-	return ShortRead(strings.ToUpper(raw_sr))
+	return ShortRead(raw_sr)
 }
 
 func (sr ShortRead) Len() int {
@@ -49,14 +49,11 @@ func (sr ShortRead) Substring(start int, end_before int) string {
 }
 
 func (sr ShortRead) GetKmers(k int) []debruijn.Kmer {
-	num_kmers := sr.Len() - k + 1
-	kmers := make([]debruijn.Kmer, num_kmers)
-
-	for i := range kmers {
-		kmers[i] = debruijn.NewKmer(sr.Substring(i, i + k))
-	}
+	return debruijn.KmersFromSequence(string(sr), k)
+}
 
-	return kmers
+func (sr ShortRead) AddToGraph(k int, graph debruijn.Graph) {
+	debruijn.AddSequenceToGraph(graph, string(sr), k)
 }
 
 // ===================================
@@ -76,7 +73,7 @@ func GraphFromFastQ(fragment string, k int, graph debruijn.Graph) debruijn.Graph
 		if (i - 1) % 4 == 0 {
 			tmp++
 			sr := NewShortRead(s.Text())
-			graph.AddNodes(sr.GetKmers(k))
+			sr.AddToGraph(k, graph)
 
 			if tmp == 10000 {
 				return graph
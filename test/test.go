@@ -2,12 +2,14 @@ package test
 
 import (
 	"fmt"
-	// "sync"
+	"sort"
+	"sync"
 
 	"velour/seqio"
 	"velour/debruijn"
 	"velour/debruijn/hashmap"
 	"velour/debruijn/sortedlist"
+	debruijn_sync "velour/debruijn/sync"
 )
 
 func printGraphData(graph debruijn.Graph) {
@@ -43,37 +45,135 @@ func TestSortedGraph(fragments []string, k int) debruijn.Graph {
 	return graph
 }
 
-// func TestSequentialWithLocks(fragments []string, k int) debruijn.Graph {
-// 	fmt.Println("\nTesting Sequential with Locks Graph Read")
-//
-// 	var graph debruijn.Graph = debruijn.debruijn_sync.NewGraph(debruijn.hmgraph.NewGraph())
-//
-// 	for _, fragment := range fragments {
-// 		kmerio.GraphFromFastQ(fragment, k, graph)
-// 	}
-//
-// 	printGraphData(graph)
-// 	return graph
-// }
-//
-// func TestConcurrent(fragments []string, k int) debruijn.Graph {
-// 	fmt.Println("\nTesting Concurrent Graph Read")
-//
-// 	var graph debruijn.Graph = debruijn_sync.NewGraph()
-// 	wg := &sync.WaitGroup{}
-//
-// 	for _, fragment := range fragments {
-// 		wg.Add(1)
-//
-// 		go func(fragment string) {
-// 			defer wg.Done()
-//
-// 			kmerio.GraphFromFastQ(fragment, k, graph)
-// 		}(fragment)
-// 	}
-//
-// 	wg.Wait()
-//
-// 	printGraphData(graph)
-// 	return graph
-// }
+func TestSequentialWithLocks(fragments []string, k int) debruijn.Graph {
+	fmt.Println("\nTesting Sequential with Locks Graph Read")
+
+	var node_gen debruijn.NodeGenerator = debruijn_sync.NewNodeGenerator(hmgraph.NewNode)
+	var graph debruijn.Graph = debruijn_sync.NewGraph(hmgraph.NewGraph(node_gen))
+
+	for _, fragment := range fragments {
+		seqio.GraphFromFastQ(fragment, k, graph)
+	}
+
+	printGraphData(graph)
+	return graph
+}
+
+func TestContigExtraction() bool {
+	fmt.Println("\nTesting Contig Extraction")
+
+	seq := "ACGTTGCAGGCTAACGTACGATCAGTACGGA"
+	k := 5
+
+	var hm_graph debruijn.Graph = hmgraph.NewGraph(hmgraph.NewNode)
+	debruijn.AddSequenceToGraph(hm_graph, seq, k)
+
+	var sorted_graph debruijn.Graph = sortedgraph.NewGraph(sortedgraph.NewNode)
+	debruijn.AddSequenceToGraph(sorted_graph, seq, k)
+
+	hm_contigs := debruijn.ExtractContigs(hm_graph)
+	sorted_contigs := debruijn.ExtractContigs(sorted_graph)
+
+	sort.Strings(hm_contigs)
+	sort.Strings(sorted_contigs)
+
+	if len(sorted_contigs) == sorted_graph.Len() {
+		fmt.Println("FAIL: sorted backend emitted one contig per kmer; its graph has no edges")
+		return false
+	}
+
+	if len(hm_contigs) != len(sorted_contigs) {
+		fmt.Println("FAIL: backends disagree on contigs")
+		fmt.Println("HashMap Contigs:", hm_contigs)
+		fmt.Println("Sorted  Contigs:", sorted_contigs)
+		return false
+	}
+
+	for i := range hm_contigs {
+		if hm_contigs[i] != sorted_contigs[i] {
+			fmt.Println("FAIL: backends disagree on contigs")
+			fmt.Println("HashMap Contigs:", hm_contigs)
+			fmt.Println("Sorted  Contigs:", sorted_contigs)
+			return false
+		}
+	}
+
+	fmt.Println("Contigs agree across backends:", hm_contigs)
+	return true
+}
+
+func TestEdgeSymmetry() bool {
+	fmt.Println("\nTesting Edge Symmetry")
+
+	seq := "ACGTTGCAGGCTAACGTACGATCAGTACGGA"
+	k := 5
+
+	var hm_graph debruijn.Graph = hmgraph.NewGraph(hmgraph.NewNode)
+	debruijn.AddSequenceToGraph(hm_graph, seq, k)
+
+	var sorted_graph debruijn.Graph = sortedgraph.NewGraph(sortedgraph.NewNode)
+	debruijn.AddSequenceToGraph(sorted_graph, seq, k)
+
+	if !verifyEdgeSymmetry(hm_graph) {
+		fmt.Println("FAIL: hashmap backend has asymmetric edges")
+		return false
+	}
+
+	if !verifyEdgeSymmetry(sorted_graph) {
+		fmt.Println("FAIL: sorted backend has asymmetric edges")
+		return false
+	}
+
+	fmt.Println("Edges are symmetric across backends")
+	return true
+}
+
+func verifyEdgeSymmetry(graph debruijn.Graph) bool {
+	nts := [4]byte{'A', 'C', 'G', 'T'}
+
+	for id := 0; id < graph.Len(); id++ {
+		node := graph.GetNodeByID(id)
+		kmer := node.GetKmer()
+
+		for _, nt := range node.GetSuccessors() {
+			succ_kmer := kmer.GenerateSuccessor(nts[nt])
+
+			if _, succ_node, ok := graph.GetNode(succ_kmer); !ok || !succ_node.IsAPredecessor(kmer.GetFirstNucleotide()) {
+				return false
+			}
+		}
+
+		for _, nt := range node.GetPredecessors() {
+			prec_kmer := kmer.GeneratePredecessor(nts[nt])
+
+			if _, prec_node, ok := graph.GetNode(prec_kmer); !ok || !prec_node.IsASuccessor(kmer.GetLastNucleotide()) {
+				return false
+			}
+		}
+	}
+
+	return true
+}
+
+func TestConcurrent(fragments []string, k int) debruijn.Graph {
+	fmt.Println("\nTesting Concurrent Graph Read")
+
+	var node_gen debruijn.NodeGenerator = debruijn_sync.NewNodeGenerator(hmgraph.NewNode)
+	var graph debruijn.Graph = debruijn_sync.NewGraph(hmgraph.NewGraph(node_gen))
+	wg := &sync.WaitGroup{}
+
+	for _, fragment := range fragments {
+		wg.Add(1)
+
+		go func(fragment string) {
+			defer wg.Done()
+
+			seqio.GraphFromFastQ(fragment, k, graph)
+		}(fragment)
+	}
+
+	wg.Wait()
+
+	printGraphData(graph)
+	return graph
+}
@@ -14,6 +14,9 @@ func TimeAll(fragments []string, k int) {
 
 	TimeSortedGraph(fragments, k)
 	runtime.GC()
+
+	TimeConcurrent(fragments, k)
+	runtime.GC()
 }
 
 func TimeHMGraph(fragments []string, k int) {
@@ -31,3 +34,11 @@ func TimeSortedGraph(fragments []string, k int) {
 
 	fmt.Println("Time of Sorted Graph", elapsed)
 }
+
+func TimeConcurrent(fragments []string, k int) {
+	start := time.Now()
+	test.TestConcurrent(fragments, k)
+	elapsed := time.Since(start)
+
+	fmt.Println("Time of Concurrent Graph", elapsed)
+}
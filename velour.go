@@ -4,6 +4,7 @@ import (
 	"fmt"
 
 	"velour/seqio"
+	"velour/test"
 	"velour/test/time"
 
 	// "github.com/pkg/profile"
@@ -14,6 +15,9 @@ func main() {
 
 	fragments := []string{"data/staphylococcus_aureus/frag1.fastq", "data/staphylococcus_aureus/frag2.fastq"}
 
+	test.TestContigExtraction()
+	test.TestEdgeSymmetry()
+
 	k := seqio.EstimateK(2900000)
 	fmt.Println("Estimated K:", k)
 